@@ -1,6 +1,6 @@
 from src.app.db.base import Base
-from src.app.models.project import Project
-from src.app.models.task import Task
+from src.app.models.project_orm import ProjectORM
+from src.app.models.task_orm import TaskORM
 from pathlib import Path
 from dotenv import load_dotenv
 env_path = Path(__file__).resolve().parent.parent / ".env"
@@ -4,11 +4,8 @@ This file initializes all the necessary components (repository, service, CLI) an
 the application's CLI. It is the root of the application.
 """
 
-import os
-
-from dotenv import load_dotenv
-
 from src.app.cli.console import Cli
+from src.app.config import get_settings
 from src.app.db.session import SessionLocal
 from src.app.repositories.sqlalchemy_repository import SqlAlchemyProjectRepository
 from src.app.services.project_service import ProjectService
@@ -16,10 +13,7 @@ from src.app.services.project_service import ProjectService
 
 def main() -> None:
     """Run the application."""
-    load_dotenv()
-
-    max_projects = int(os.environ.get("MAX_NUMBER_OF_PROJECT"))
-    max_tasks = int(os.environ.get("MAX_NUMBER_OF_TASK"))
+    settings = get_settings()
 
     # Create a new database session
     db_session = SessionLocal()
@@ -27,7 +21,8 @@ def main() -> None:
     try:
         # Initialize the SQLAlchemy repository with the session
         repository = SqlAlchemyProjectRepository(session=db_session)
-        service = ProjectService(repository, max_projects, max_tasks)
+        service = ProjectService(repository, settings.max_projects,
+                                 settings.max_tasks)
         cli = Cli(service)
 
         cli.run()
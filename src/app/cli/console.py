@@ -5,32 +5,46 @@ It handles command parsing, calls the appropriate service methods, and displays
 the results or errors to the user.
 """
 
-import shlex
+import re
+import sys
+from collections.abc import Callable, Iterator
+from datetime import datetime
 
 from src.app.exceptions.base import TodolistError
 from src.app.services.project_service import ProjectService
 
+# shlex only splits on space, tab, CR and LF and gives quotes and backslashes
+# a meaning, while str.split() also breaks on the other ASCII separators
+# (\v, \f, \x1c-\x1f) and on Unicode whitespace. Lines containing any of
+# these go through shlex; everything else can use the faster plain split.
+_needs_shlex = re.compile(r"[\"'\\\x0b\x0c\x1c-\x1f]").search
+
+# Written with a single call at startup and on 'help'.
+_HELP_TEXT = (
+    "Available commands:\n"
+    "  create_project <name> <description>\n"
+    "  add_task <project_id> <title> <description> [deadline:YYYY-MM-DD]\n"
+    "  edit_task <project_id> <task_id> <title> <description> "
+    "<status> [deadline:YYYY-MM-DD]\n"
+    "  delete_task <project_id> <task_id>\n"
+    "  set_task_status <project_id> <task_id> <todo|doing|done>\n"
+    "  list_tasks <project_id>\n"
+    "  edit_project <project_id> <new_name> <new_description>\n"
+    "  delete_project <project_id>\n"
+    "  list_projects\n"
+    "  help\n"
+    "  exit\n"
+)
+
+def _fmt_date(d: datetime) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
 class Cli:
     """The command-line interface for the application."""
 
     def __init__(self, service: ProjectService):
         self._service = service
-        self._commands = {
-            # Project Commands
-            "create_project": self._create_project,
-            "list_projects": self._list_projects,
-            "edit_project": self._edit_project,
-            "delete_project": self._delete_project,
-            # Task Commands
-            "add_task": self._add_task,
-            "list_tasks": self._list_tasks,
-            "edit_task": self._edit_task,
-            "delete_task": self._delete_task,
-            "set_task_status": self._set_task_status,
-            # System Commands
-            "help": self._display_help,
-            "exit": self._exit,
-        }
 
     def _parse_id(self, id_str: str, entity_name: str) -> int | None:
         """Helper function to parse an ID string to an int and handle errors."""
@@ -42,19 +56,7 @@ class Cli:
 
     def _display_help(self, args: list[str]) -> None:
         """Displays the available commands."""
-        print("Available commands:")
-        print("  create_project <name> <description>")
-        print("  add_task <project_id> <title> <description> [deadline:YYYY-MM-DD]")
-        print("  edit_task <project_id> <task_id> <title> <description> "
-              "<status> [deadline:YYYY-MM-DD]")
-        print("  delete_task <project_id> <task_id>")
-        print("  set_task_status <project_id> <task_id> <todo|doing|done>")
-        print("  list_tasks <project_id>")
-        print("  edit_project <project_id> <new_name> <new_description>")
-        print("  delete_project <project_id>")
-        print("  list_projects")
-        print("  help")
-        print("  exit")
+        sys.stdout.write(_HELP_TEXT)
 
     def _exit(self, args: list[str]) -> None:
         """Exits the application."""
@@ -62,10 +64,6 @@ class Cli:
 
     def _create_project(self, args: list[str]) -> None:
         """Handles the create_project command."""
-        if len(args) != 2:
-            print("Invalid number of arguments.")
-            return
-
         title, description = args
         project = self._service.create_project(title, description)
         print(f"Created project '{project.name}' with ID {project.id}.")
@@ -77,19 +75,17 @@ class Cli:
             print("No projects found.")
             return
 
-        print("Projects:")
+        # Build the whole listing and write it once instead of printing per row.
+        lines = ["Projects:"]
         for project in projects:
-            created_date = project.created_at.strftime("%Y-%m-%d")
-            print(f"  - ID: {project.id}, Name: '{project.name}', "
-                  f"Description: '{project.description}', "
-                  f"Created: {created_date}")
+            created_date = _fmt_date(project.created_at)
+            lines.append(f"  - ID: {project.id}, Name: '{project.name}', "
+                         f"Description: '{project.description}', "
+                         f"Created: {created_date}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _add_task(self, args: list[str]) -> None:
         """Handles the add_task command."""
-        if not (3 <= len(args) <= 4):
-            print("Invalid number of arguments.")
-            return
-
         project_id_str, title, description = args[:3]
         deadline = args[3] if len(args) == 4 else None
 
@@ -104,10 +100,6 @@ class Cli:
 
     def _edit_project(self, args: list[str]) -> None:
         """Handles the edit_project command."""
-        if len(args) != 3:
-            print("Invalid number of arguments.")
-            return
-
         project_id_str, new_name, new_description = args
         project_id = self._parse_id(project_id_str, "Project")
         if project_id is None:
@@ -118,10 +110,6 @@ class Cli:
 
     def _delete_project(self, args: list[str]) -> None:
         """Handles the delete_project command."""
-        if len(args) != 1:
-            print("Invalid number of arguments.")
-            return
-
         project_id_str = args[0]
         project_id = self._parse_id(project_id_str, "Project")
         if project_id is None:
@@ -132,10 +120,6 @@ class Cli:
 
     def _set_task_status(self, args: list[str]) -> None:
         """Handles the set_task_status command."""
-        if len(args) != 3:
-            print("Invalid number of arguments.")
-            return
-
         project_id_str, task_id_str, new_status = args
         project_id = self._parse_id(project_id_str, "Project")
         task_id = self._parse_id(task_id_str, "Task")
@@ -149,34 +133,26 @@ class Cli:
 
     def _list_tasks(self, args: list[str]) -> None:
         """Handles the list_tasks command."""
-        if len(args) != 1:
-            print("Invalid number of arguments.")
-            return
-
         project_id_str = args[0]
         project_id = self._parse_id(project_id_str, "Project")
         if project_id is None:
             return
 
-        project = self._service.find_project_by_id(project_id)
-        print(f"Tasks of project '{project.name}' with ID {project.id}:")
+        project = self._service.view_project(project_id)
+        lines = [f"Tasks of project '{project.name}' with ID {project.id}:"]
         if not project.tasks:
-            print("  No tasks found.")
-            return
+            lines.append("  No tasks found.")
 
         for task in project.tasks:
-            deadline_str = task.deadline.strftime("%Y-%m-%d") if task.deadline else \
+            deadline_str = _fmt_date(task.deadline) if task.deadline else \
                 "No deadline assigned"
-            print(f"  - Task ID: {task.id}, Status: {task.status}")
-            print(f"  - Title: {task.title}, Description: {task.description}")
-            print(f"  - Deadline: {deadline_str}")
+            lines.append(f"  - Task ID: {task.id}, Status: {task.status}")
+            lines.append(f"  - Title: {task.title}, Description: {task.description}")
+            lines.append(f"  - Deadline: {deadline_str}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _edit_task(self, args: list[str]) -> None:
         """Handles the edit_task command."""
-        if not 5 <= len(args) <= 6:
-            print("Invalid number of arguments.")
-            return
-
         project_id_str, task_id_str, new_title, new_description, new_status = args[:5]
         new_deadline = args[5] if len(args) == 6 else None
 
@@ -194,10 +170,6 @@ class Cli:
 
     def _delete_task(self, args: list[str]) -> None:
         """Handles the delete_task command."""
-        if len(args) != 2:
-            print("Invalid number of arguments.")
-            return
-
         project_id_str, task_id_str = args
         project_id = self._parse_id(project_id_str, "Project")
         task_id = self._parse_id(task_id_str, "Task")
@@ -208,25 +180,73 @@ class Cli:
         self._service.delete_task(project_id, task_id)
         print(f"Deleted task with ID {task_id} in project ID {project_id}.")
 
+    # Command name -> (handler, min args, max args). The handlers are the plain
+    # functions defined above, called as handler(self, args), so no bound method
+    # is created per instance or per call. The argument count is checked in run();
+    # commands without arguments ignore any extra ones, as they always have.
+    _COMMANDS: dict[str, tuple[Callable[["Cli", list[str]], None], int, int]] = {
+        # Project Commands
+        "create_project": (_create_project, 2, 2),
+        "list_projects": (_list_projects, 0, sys.maxsize),
+        "edit_project": (_edit_project, 3, 3),
+        "delete_project": (_delete_project, 1, 1),
+        # Task Commands
+        "add_task": (_add_task, 3, 4),
+        "list_tasks": (_list_tasks, 1, 1),
+        "edit_task": (_edit_task, 5, 6),
+        "delete_task": (_delete_task, 2, 2),
+        "set_task_status": (_set_task_status, 3, 3),
+        # System Commands
+        "help": (_display_help, 0, sys.maxsize),
+        "exit": (_exit, 0, sys.maxsize),
+    }
+
+    @staticmethod
+    def _read_lines() -> Iterator[str]:
+        """Yield input lines, prompting only when attached to a terminal.
+
+        Piped input is read straight from sys.stdin, which is much cheaper than
+        calling input() for every line.
+        """
+        if sys.stdin.isatty():
+            while True:
+                yield input("> ")
+        else:
+            for line in sys.stdin:
+                yield line.rstrip("\n")
+
     def run(self) -> None:
         """Main loop for the CLI"""
         self._display_help([])
-        while True:
+        get_command = self._COMMANDS.get
+        for raw_input in self._read_lines():
             try:
-                raw_input = input("> ")
                 if not raw_input:
                     continue
 
-                parts = shlex.split(raw_input)
+                # Plain ASCII input without quoting splits identically and faster.
+                if not raw_input.isascii() or _needs_shlex(raw_input):
+                    # Imported lazily: most commands never need it.
+                    import shlex
+                    parts = shlex.split(raw_input)
+                else:
+                    parts = raw_input.split()
+                if not parts:
+                    continue
                 command_str = parts[0]
                 args = parts[1:]
 
-                command = self._commands.get(command_str)
+                command = get_command(command_str)
                 if command is None:
                     print("Invalid command. Type 'help' for a list of commands.")
                     continue
 
-                command(args)
+                handler, min_args, max_args = command
+                if not min_args <= len(args) <= max_args:
+                    print("Invalid number of arguments.")
+                    continue
+
+                handler(self, args)
 
             except TodolistError as e:
                 print(f"Error: {e}")
\ No newline at end of file
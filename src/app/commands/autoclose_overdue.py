@@ -1,30 +1,41 @@
 """A command-line script to automatically close overdue tasks."""
-import os
 
-from dotenv import load_dotenv
+import logging
+import sys
 
-from src.app.db.session import SessionLocal
+from sqlalchemy import text
+
+from src.app.config import get_settings
+from src.app.db.session import SessionLocal, UnpooledSessionLocal
 from src.app.repositories.sqlalchemy_repository import SqlAlchemyProjectRepository
 from src.app.services.project_service import ProjectService
 
+logger = logging.getLogger(__name__)
+
 
-def run_autoclose():
-    """Initializes dependencies and runs the auto-closing service logic."""
-    print("Running job: Auto-closing overdue tasks...")
-    load_dotenv()
+def run_autoclose(pooled: bool = False):
+    """Initializes dependencies and runs the auto-closing service logic.
 
-    max_projects = int(os.environ.get("MAX_NUMBER_OF_PROJECT"))
-    max_tasks = int(os.environ.get("MAX_NUMBER_OF_TASK"))
+    :param pooled: Use the pooled engine. Only worth it for long-running callers
+        such as the scheduler; a one-shot run opens a single unpooled connection.
+    """
+    logger.info("Running job: Auto-closing overdue tasks...")
+    settings = get_settings()
 
-    db_session = SessionLocal()
+    db_session = SessionLocal() if pooled else UnpooledSessionLocal()
     try:
+        # Closing overdue tasks is idempotent and re-run by the next job, so the
+        # commit does not need to wait for the WAL flush.
+        db_session.execute(text("SET LOCAL synchronous_commit TO OFF"))
         repo = SqlAlchemyProjectRepository(session=db_session)
-        service = ProjectService(repo, max_projects, max_tasks)
+        service = ProjectService(repo, settings.max_projects, settings.max_tasks)
         closed_count = service.autoclose_overdue_tasks()
-        print(f"Successfully closed {closed_count} overdue tasks.")
+        logger.info("Successfully closed %d overdue tasks.", closed_count)
     finally:
         db_session.close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s",
+                        stream=sys.stderr)
     run_autoclose()
\ No newline at end of file
@@ -1,19 +1,28 @@
 """Scheduler to run periodic jobs."""
 
+import logging
+import sys
 import time
 import schedule
 
 from src.app.commands.autoclose_overdue import run_autoclose
 
+logger = logging.getLogger(__name__)
+
 def main():
     """Sets up and runs the scheduled jobs."""
-    print("Starting scheduler...")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s",
+                        stream=sys.stderr)
+    logger.info("Starting scheduler...")
 
-    schedule.every(15).minutes.do(run_autoclose)
+    schedule.every(15).minutes.do(run_autoclose, pooled=True)
 
     while True:
         schedule.run_pending()
-        time.sleep(1)
+        # Sleep until the next job is due instead of waking up every second,
+        # but at least a second so an overdue or missing job cannot spin the loop.
+        idle = schedule.idle_seconds()
+        time.sleep(max(1, idle if idle is not None else 60))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
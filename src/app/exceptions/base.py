@@ -9,6 +9,10 @@ class EntityDoesNotExistError(TodolistError):
     def __init__(self, entity_name: str, entity_id: int):
         super().__init__(f"Entity {entity_name} with ID {entity_id} does not exist.")
 
+class ConfigurationError(TodolistError):
+    """Raised when a required setting is missing or malformed."""
+    pass
+
 class ValidationError(TodolistError):
     """Raised when a business rule or data constraint is violated."""
     pass
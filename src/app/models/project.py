@@ -1,31 +1,19 @@
-"""ORM model for a Project."""
+"""Domain model for a Project."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Integer, String, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from .task import Task
 
-from src.app.db.base import Base
+@dataclass(slots=True)
+class Project:
+    """A single project that can contain multiple tasks.
 
-if TYPE_CHECKING:
-    from .task import Task
-
-class Project(Base):
-    """A single project that can contain multiple tasks."""
-    __tablename__ = "projects"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    name: Mapped[str] = mapped_column(String(30), unique=True, nullable=False)
-    description: Mapped[str] = mapped_column(String(150), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
-    )
-
-    # Relationship to tasks
-    tasks: Mapped[list["Task"]] = relationship(
-        backref="project", cascade="all, delete-orphan"
-    )
-
-    def __repr__(self) -> str:
-        return f"<Project(id={self.id}, name='{self.name}')>"
\ No newline at end of file
+    This is a plain data object used by the service and CLI layers. The database
+    mapping lives in project_orm.py.
+    """
+    id: int
+    name: str
+    description: str
+    created_at: datetime = field(default_factory=datetime.now)
+    tasks: list[Task] = field(default_factory=list)
@@ -0,0 +1,31 @@
+"""ORM model for a Project."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.app.db.base import Base
+
+if TYPE_CHECKING:
+    from .task_orm import TaskORM
+
+class ProjectORM(Base):
+    """Database row of a project. Converted to a Project at the repository boundary."""
+    __tablename__ = "projects"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(30), unique=True, nullable=False)
+    description: Mapped[str] = mapped_column(String(150), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    # Relationship to tasks
+    tasks: Mapped[list["TaskORM"]] = relationship(
+        backref="project", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectORM(id={self.id}, name='{self.name}')>"
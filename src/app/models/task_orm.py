@@ -0,0 +1,34 @@
+"""ORM model for a Task."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.db.base import Base
+from .task import TaskStatus
+
+class TaskORM(Base):
+    """Database row of a task. Converted to a Task at the repository boundary."""
+    __tablename__ = "tasks"
+    __table_args__ = (
+        # Partial index over open tasks only; serves the overdue-task scan
+        # (status <> 'done' AND deadline < now()) while staying small.
+        Index("ix_tasks_open_deadline", "deadline",
+              postgresql_where=text("status <> 'done'")),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"))
+    title: Mapped[str] = mapped_column(String(30), nullable=False)
+    description: Mapped[str] = mapped_column(String(150), nullable=True)
+    status: Mapped[TaskStatus] = mapped_column(String, default="todo", nullable=False)
+    deadline: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
+    def __repr__(self) -> str:
+        return f"<TaskORM(id={self.id}, title='{self.title}')>"
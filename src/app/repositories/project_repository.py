@@ -5,9 +5,8 @@ implementation. The current design allows the storage backend to be swapped (e.g
 database for later phases of the project) without changing the business logic.
 """
 
-import copy
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 
 from src.app.exceptions.base import EntityDoesNotExistError
@@ -28,11 +27,22 @@ class IProjectRepository(ABC):
         """Returns a list of all projects (sorted by creation time)."""
         pass
 
+    @abstractmethod
+    def count_projects(self) -> int:
+        """Returns the number of existing projects."""
+        pass
+
     @abstractmethod
     def find_project_by_id(self, id: int) -> Project:
         """Returns the project with the id. Raises EntityDoesNotExist if not found."""
         pass
 
+    @abstractmethod
+    def view_project(self, id: int) -> Project:
+        """Like find_project_by_id, but the result may share state with the
+        repository and must only be read, never modified."""
+        pass
+
     @abstractmethod
     def find_project_by_name(self, name: str) -> Project | None:
         """Returns the project with the given name. This method does not raise an
@@ -40,9 +50,16 @@ class IProjectRepository(ABC):
          name of a new project isn't a duplicate)."""
         pass
 
+    @abstractmethod
+    def find_project_id_by_name(self, name: str) -> int | None:
+        """Returns the ID of the project with the given name, or None. A cheaper
+        alternative to find_project_by_name when only existence or the ID matters."""
+        pass
+
     @abstractmethod
     def update_project(self, id: int, new_name: str, new_description: str) -> Project:
-        """Edits an existing project's details."""
+        """Edits an existing project's details. The returned project's tasks are
+        not guaranteed to be populated."""
         pass
 
     @abstractmethod
@@ -56,6 +73,14 @@ class IProjectRepository(ABC):
         """Creates a new task within a project."""
         pass
 
+    @abstractmethod
+    def bulk_create_tasks(self, project_id: int,
+                          tasks: Sequence[tuple[str, str, datetime | None]]
+                          ) -> Sequence[Task]:
+        """Creates several tasks in a project at once. Each entry of tasks is a
+        (title, description, deadline) tuple."""
+        pass
+
     @abstractmethod
     def update_task_status(self, project_id: int,
                            task_id: int, new_status: TaskStatus) -> Task:
@@ -76,16 +101,44 @@ class IProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def find_overdue_tasks(self) -> Sequence[Task]:
-        """Returns a list of all tasks that are past their deadline and not done."""
+    def find_overdue_tasks(self) -> Iterator[Task]:
+        """Yields all tasks that are past their deadline and not done."""
         pass
 
+    @abstractmethod
+    def close_overdue_tasks(self) -> int:
+        """Marks every overdue task as done and returns how many were closed."""
+        pass
+
+def _clone_task(task: Task) -> Task:
+    """Return a copy of a task, field by field.
+
+    Much cheaper than a deep copy, and safe because every field is immutable.
+    """
+    return Task(id=task.id, project_id=task.project_id, title=task.title,
+                description=task.description, status=task.status,
+                deadline=task.deadline, created_at=task.created_at,
+                closed_at=task.closed_at)
+
+
+def _clone_project(project: Project, tasks: Iterable[Task]) -> Project:
+    """Return a copy of a project holding copies of the given tasks."""
+    return Project(id=project.id, name=project.name,
+                   description=project.description, created_at=project.created_at,
+                   tasks=[_clone_task(task) for task in tasks])
+
+
 class InMemoryProjectRepository(IProjectRepository):
     """In-memory implementation of a project repository."""
 
     def __init__(self):
         self._projects: dict[int, Project] = {}
+        self._projects_by_name: dict[str, Project] = {}
+        # Tasks are kept here, per project and keyed by task ID, rather than in
+        # the stored projects' task lists: lookups, edits and deletes are O(1).
+        self._tasks: dict[int, dict[int, Task]] = {}
         self._next_project_id: int = 1
+        self._next_task_id: int = 1
 
     def _get_project_or_raise(self, id: int) -> Project:
         """Return a project by its ID or raise EntityDoesNotExistError."""
@@ -94,57 +147,85 @@ class InMemoryProjectRepository(IProjectRepository):
             raise EntityDoesNotExistError("Project", id)
         return project
 
-    @staticmethod
-    def _find_task_or_raise(project: Project, task_id: int) -> Task:
+    def _copy_project(self, project: Project) -> Project:
+        """Return a copy of a stored project with its tasks filled in."""
+        return _clone_project(project, self._tasks[project.id].values())
+
+    def _find_task_or_raise(self, project: Project, task_id: int) -> Task:
         """Find a task in a project by its ID or raise EntityDoesNotExistError."""
-        for task in project.tasks:
-            if task.id == task_id:
-                return task
-        raise EntityDoesNotExistError("Task", task_id)
+        task = self._tasks[project.id].get(task_id)
+        if task is None:
+            raise EntityDoesNotExistError("Task", task_id)
+        return task
 
     def create_project(self, name: str, description: str) -> Project:
         project_id = self._next_project_id
         project = Project(id=project_id, name=name, description=description)
         self._projects[project_id] = project
+        self._tasks[project_id] = {}
+        self._projects_by_name[name] = project
         self._next_project_id += 1
-        return copy.deepcopy(project)
+        return self._copy_project(project)
 
     def list_projects(self) -> Sequence[Project]:
-        all_projects = self._projects.values()
-        sorted_projects = sorted(all_projects, key=lambda p: p.creation_date)
-        return [copy.deepcopy(project) for project in sorted_projects]
+        # Projects are inserted in creation order and dicts keep insertion order,
+        # so the values are already sorted by creation time.
+        return [self._copy_project(project) for project in self._projects.values()]
+
+    def count_projects(self) -> int:
+        return len(self._projects)
 
     def find_project_by_id(self, id: int) -> Project:
-        # The difference between this method and _get_project_or_raise is the deep copy.
-        return copy.deepcopy(self._get_project_or_raise(id))
+        # The difference between this method and _get_project_or_raise is the copy.
+        return self._copy_project(self._get_project_or_raise(id))
+
+    def view_project(self, id: int) -> Project:
+        # Only the project shell is built; the tasks are the stored ones.
+        project = self._get_project_or_raise(id)
+        return Project(id=project.id, name=project.name,
+                       description=project.description, created_at=project.created_at,
+                       tasks=list(self._tasks[id].values()))
 
     def find_project_by_name(self, name: str) -> Project | None:
-        for project in self._projects.values():
-            if project.name == name:
-                return copy.deepcopy(project)
-        return None
+        project = self._projects_by_name.get(name)
+        return self._copy_project(project) if project is not None else None
+
+    def find_project_id_by_name(self, name: str) -> int | None:
+        project = self._projects_by_name.get(name)
+        return project.id if project is not None else None
 
     def update_project(self, id: int, new_name: str, new_description: str) -> Project:
         project = self._get_project_or_raise(id)
+        del self._projects_by_name[project.name]
         project.name = new_name
         project.description = new_description
-        return copy.deepcopy(project)
+        self._projects_by_name[new_name] = project
+        return self._copy_project(project)
 
     def delete_project(self, id: int) -> None:
-        self._get_project_or_raise(id) # To check for existence
+        project = self._get_project_or_raise(id)
         del self._projects[id]
+        del self._projects_by_name[project.name]
+        del self._tasks[id]
 
     def create_task(self, project_id: int, title: str,
                     description: str, deadline: datetime | None) -> Task:
 
-        project = self._get_project_or_raise(project_id)
+        self._get_project_or_raise(project_id)
 
-        task = Task(id=project._next_task_id, title=title,
+        task = Task(id=self._next_task_id, project_id=project_id, title=title,
                     description=description, deadline=deadline)
-        project._next_task_id += 1
+        self._next_task_id += 1
+
+        self._tasks[project_id][task.id] = task
+        return _clone_task(task)
 
-        project.tasks.append(task)
-        return copy.deepcopy(task)
+    def bulk_create_tasks(self, project_id: int,
+                          tasks: Sequence[tuple[str, str, datetime | None]]
+                          ) -> Sequence[Task]:
+        self._get_project_or_raise(project_id)
+        return [self.create_task(project_id, title, description, deadline)
+                for title, description, deadline in tasks]
 
     def update_task_status(self, project_id: int,
                            task_id: int, new_status: TaskStatus) -> Task:
@@ -152,7 +233,7 @@ class InMemoryProjectRepository(IProjectRepository):
 
         task = self._find_task_or_raise(project, task_id)
         task.status = new_status
-        return copy.deepcopy(task)
+        return _clone_task(task)
 
     def update_task(self, project_id: int, task_id: int, new_title: str,
                     new_description: str, new_status: TaskStatus,
@@ -167,19 +248,28 @@ class InMemoryProjectRepository(IProjectRepository):
         task.deadline = new_deadline
         task.closed_at = new_closed_at
 
-        return copy.deepcopy(task)
+        return _clone_task(task)
 
     def delete_task(self, project_id: int, task_id: int) -> None:
         project = self._get_project_or_raise(project_id)
-        task = self._find_task_or_raise(project, task_id)
-        project.tasks.remove(task)
+        self._find_task_or_raise(project, task_id)
+        del self._tasks[project_id][task_id]
+
+    def find_overdue_tasks(self) -> Iterator[Task]:
+        """Yields all tasks that are past their deadline and not done."""
+        now = datetime.now()
+        for tasks in self._tasks.values():
+            for task in tasks.values():
+                if task.deadline and task.deadline < now and task.status != "done":
+                    yield _clone_task(task)
 
-    def find_overdue_tasks(self) -> Sequence[Task]:
-        """Returns a list of all tasks that are past their deadline and not done."""
+    def close_overdue_tasks(self) -> int:
         now = datetime.now()
-        overdue_tasks = []
-        for project in self._projects.values():
-            for task in project.tasks:
+        closed_count = 0
+        for tasks in self._tasks.values():
+            for task in tasks.values():
                 if task.deadline and task.deadline < now and task.status != "done":
-                    overdue_tasks.append(copy.deepcopy(task))
-        return overdue_tasks
+                    task.status = "done"
+                    task.closed_at = now
+                    closed_count += 1
+        return closed_count
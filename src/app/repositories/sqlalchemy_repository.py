@@ -1,94 +1,210 @@
 """SQLAlchemy implementation of the project repository."""
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
 from src.app.exceptions.base import EntityDoesNotExistError
 from src.app.models.project import Project
+from src.app.models.project_orm import ProjectORM
 from src.app.models.task import Task, TaskStatus
+from src.app.models.task_orm import TaskORM
 from .project_repository import IProjectRepository
 
+# Statements built once at import time; each call only binds parameters and hits
+# the compiled-SQL cache instead of rebuilding the statement tree.
+_STMT_LIST_PROJECTS = (
+    select(ProjectORM)
+    .options(selectinload(ProjectORM.tasks))
+    .order_by(ProjectORM.created_at)
+)
+_STMT_COUNT_PROJECTS = select(func.count()).select_from(ProjectORM)
+_STMT_PROJECT_BY_NAME = (
+    select(ProjectORM)
+    .options(selectinload(ProjectORM.tasks))
+    .where(ProjectORM.name == bindparam("name"))
+)
+_STMT_PROJECT_ID_BY_NAME = (
+    select(ProjectORM.id).where(ProjectORM.name == bindparam("name"))
+)
+_STMT_OVERDUE_TASKS = (
+    select(TaskORM)
+    .where(TaskORM.deadline < func.now(), TaskORM.status != "done")
+    .execution_options(yield_per=500)
+)
+_STMT_CLOSE_OVERDUE_TASKS = (
+    update(TaskORM)
+    .where(TaskORM.deadline < func.now(), TaskORM.status != "done")
+    .values(status="done", closed_at=func.now())
+    .execution_options(synchronize_session=False)
+)
+
+
+# SQLSTATE for foreign_key_violation, as reported by psycopg2 in pgcode.
+_FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _is_foreign_key_violation(error: IntegrityError) -> bool:
+    """Tell whether an IntegrityError comes from a foreign key constraint."""
+    return getattr(error.orig, "pgcode", None) == _FOREIGN_KEY_VIOLATION
+
+
+def _to_task(row: TaskORM) -> Task:
+    """Convert a task row into a domain Task."""
+    return Task(id=row.id, project_id=row.project_id, title=row.title,
+                description=row.description, status=row.status,
+                deadline=row.deadline, created_at=row.created_at,
+                closed_at=row.closed_at)
+
+
+def _to_project(row: ProjectORM, with_tasks: bool = True) -> Project:
+    """Convert a project row (and, unless told otherwise, its tasks) into a Project."""
+    tasks = [_to_task(task) for task in row.tasks] if with_tasks else []
+    return Project(id=row.id, name=row.name, description=row.description,
+                   created_at=row.created_at, tasks=tasks)
+
 
 class SqlAlchemyProjectRepository(IProjectRepository):
-    """SQLAlchemy-based repository for projects and tasks."""
+    """SQLAlchemy-based repository for projects and tasks.
+
+    Rows are converted to domain objects before the session is committed, while
+    their attributes are still loaded, so no refresh query is needed afterwards.
+    """
 
     def __init__(self, session: Session):
         self._session = session
 
-    def _get_project_or_raise(self, id: int) -> Project:
+    def _get_project_or_raise(self, id: int) -> ProjectORM:
         """Fetch a project by ID or raise an exception."""
-        project = self._session.get(Project, id)
+        project = self._session.get(ProjectORM, id)
         if not project:
             raise EntityDoesNotExistError("Project", id)
         return project
 
-    def _find_task_in_project_or_raise(self, project: Project, task_id: int) -> Task:
+    def _find_task_in_project_or_raise(self, project: ProjectORM,
+                                       task_id: int) -> TaskORM:
         """Fetch a task by ID within a project or raise an exception."""
-        task = self._session.query(Task).filter_by(project_id=project.id, id=task_id).first()
-        if not task:
+        # Primary-key lookup (served from the identity map when possible), then
+        # make sure the task actually belongs to the given project.
+        task = self._session.get(TaskORM, task_id)
+        if not task or task.project_id != project.id:
             raise EntityDoesNotExistError("Task", task_id)
         return task
 
     def create_project(self, name: str, description: str) -> Project:
-        project = Project(name=name, description=description)
-        self._session.add(project)
+        row = ProjectORM(name=name, description=description)
+        self._session.add(row)
+        self._session.flush()
+        project = _to_project(row, with_tasks=False)
         self._session.commit()
-        self._session.refresh(project)
         return project
 
     def list_projects(self) -> Sequence[Project]:
-        return self._session.query(Project).order_by(Project.created_at).all()
+        # Load every project's tasks in one extra query instead of one per project
+        rows = self._session.scalars(_STMT_LIST_PROJECTS)
+        return [_to_project(row) for row in rows]
+
+    def count_projects(self) -> int:
+        return self._session.scalar(_STMT_COUNT_PROJECTS)
 
     def find_project_by_id(self, id: int) -> Project:
         # Eagerly load tasks to avoid extra queries when accessing project.tasks
-        project = self._session.query(Project).options(joinedload(Project.tasks)).get(id)
-        if not project:
+        row = self._session.get(ProjectORM, id,
+                                options=[selectinload(ProjectORM.tasks)])
+        if not row:
             raise EntityDoesNotExistError("Project", id)
-        return project
+        return _to_project(row)
+
+    def view_project(self, id: int) -> Project:
+        # Rows are converted to fresh domain objects anyway, so nothing is shared.
+        return self.find_project_by_id(id)
 
     def find_project_by_name(self, name: str) -> Project | None:
-        return self._session.query(Project).filter(Project.name == name).first()
+        row = self._session.scalars(_STMT_PROJECT_BY_NAME, {"name": name}).first()
+        return _to_project(row) if row is not None else None
+
+    def find_project_id_by_name(self, name: str) -> int | None:
+        return self._session.scalar(_STMT_PROJECT_ID_BY_NAME, {"name": name})
 
     def update_project(self, id: int, new_name: str, new_description: str) -> Project:
-        project = self._get_project_or_raise(id)
-        project.name = new_name
-        project.description = new_description
+        row = self._get_project_or_raise(id)
+        row.name = new_name
+        row.description = new_description
+        # Tasks are not loaded here; callers only need the project's own fields.
+        project = _to_project(row, with_tasks=False)
         self._session.commit()
-        self._session.refresh(project)
         return project
 
     def delete_project(self, id: int) -> None:
-        project = self._get_project_or_raise(id)
-        self._session.delete(project)
+        row = self._get_project_or_raise(id)
+        self._session.delete(row)
         self._session.commit()
 
     def create_task(
         self, project_id: int, title: str, description: str, deadline: datetime | None
     ) -> Task:
-        # Ensure the project exists first
-        self._get_project_or_raise(project_id)
-
-        task = Task(
+        # No existence check up front: the projects.id foreign key rejects
+        # unknown projects. The service has already loaded the project by this
+        # point, so this only spares a query for direct and bulk callers.
+        row = TaskORM(
             project_id=project_id,
             title=title,
             description=description,
             deadline=deadline,
         )
-        self._session.add(task)
-        self._session.commit()
-        self._session.refresh(task)
+        self._session.add(row)
+        try:
+            self._session.flush()
+            task = _to_task(row)
+            self._session.commit()
+        except IntegrityError as error:
+            self._session.rollback()
+            if not _is_foreign_key_violation(error):
+                raise
+            raise EntityDoesNotExistError("Project", project_id) from error
         return task
 
+    def bulk_create_tasks(
+        self,
+        project_id: int,
+        tasks: Sequence[tuple[str, str, datetime | None]]
+    ) -> Sequence[Task]:
+        if not tasks:
+            return []
+        # A single multi-row INSERT ... RETURNING and one commit for the batch.
+        try:
+            rows = self._session.scalars(
+                insert(TaskORM).returning(TaskORM),
+                [
+                    {
+                        "project_id": project_id,
+                        "title": title,
+                        "description": description,
+                        "deadline": deadline,
+                    }
+                    for title, description, deadline in tasks
+                ],
+            ).all()
+            created = [_to_task(row) for row in rows]
+            self._session.commit()
+        except IntegrityError as error:
+            self._session.rollback()
+            if not _is_foreign_key_violation(error):
+                raise
+            raise EntityDoesNotExistError("Project", project_id) from error
+        return created
+
     def update_task_status(
         self, project_id: int, task_id: int, new_status: TaskStatus
     ) -> Task:
         project = self._get_project_or_raise(project_id)
-        task = self._find_task_in_project_or_raise(project, task_id)
-        task.status = new_status
+        row = self._find_task_in_project_or_raise(project, task_id)
+        row.status = new_status
+        task = _to_task(row)
         self._session.commit()
-        self._session.refresh(task)
         return task
 
     def update_task(
@@ -102,27 +218,34 @@ class SqlAlchemyProjectRepository(IProjectRepository):
         new_closed_at: datetime | None
     ) -> Task:
         project = self._get_project_or_raise(project_id)
-        task = self._find_task_in_project_or_raise(project, task_id)
-        task.title = new_title
-        task.description = new_description
-        task.status = new_status
-        task.deadline = new_deadline
-        task.closed_at = new_closed_at
+        row = self._find_task_in_project_or_raise(project, task_id)
+        row.title = new_title
+        row.description = new_description
+        row.status = new_status
+        row.deadline = new_deadline
+        row.closed_at = new_closed_at
+        task = _to_task(row)
         self._session.commit()
-        self._session.refresh(task)
         return task
 
     def delete_task(self, project_id: int, task_id: int) -> None:
         project = self._get_project_or_raise(project_id)
-        task = self._find_task_in_project_or_raise(project, task_id)
-        self._session.delete(task)
+        row = self._find_task_in_project_or_raise(project, task_id)
+        self._session.delete(row)
         self._session.commit()
 
-    def find_overdue_tasks(self) -> Sequence[Task]:
-        """Returns a list of all tasks that are past their deadline and not done."""
-        now = datetime.now()
-        return (
-            self._session.query(Task)
-            .filter(Task.deadline < now, Task.status != "done")
-            .all()
-        )
\ No newline at end of file
+    def find_overdue_tasks(self) -> Iterator[Task]:
+        """Yields all tasks that are past their deadline and not done.
+
+        Rows are fetched in batches from a server-side cursor, so memory use
+        stays bounded regardless of how many tasks are overdue.
+        """
+        rows = self._session.scalars(_STMT_OVERDUE_TASKS)
+        for row in rows:
+            yield _to_task(row)
+
+    def close_overdue_tasks(self) -> int:
+        """Closes all overdue tasks with a single UPDATE statement."""
+        result = self._session.execute(_STMT_CLOSE_OVERDUE_TASKS)
+        self._session.commit()
+        return result.rowcount
@@ -19,9 +19,19 @@ from src.app.models.project import Project
 from src.app.models.task import Task, TaskStatus
 from src.app.repositories.project_repository import IProjectRepository
 
+# Valid status -> canonical status string. One lookup both validates user input
+# and swaps it for the shared literal, so stored tasks don't each keep their own
+# copy of the status string.
+_STATUS_MAP: dict[str, TaskStatus] = {
+    status: status for status in ("todo", "doing", "done")
+}
+
 class ProjectService:
     """Handles projects and tasks, enforcing rules."""
 
+    _MAX_NAME_LEN = 30
+    _MAX_DESCRIPTION_LEN = 150
+
     def __init__(self, repo: IProjectRepository, max_projects: int, max_tasks: int):
         """Initialize the service with a repository and configuration.
 
@@ -33,28 +43,44 @@ class ProjectService:
         self._max_projects = max_projects
         self._max_tasks = max_tasks
 
+    @classmethod
+    def _validate_lengths(cls, entity: str, name_field: str,
+                          name: str, description: str) -> None:
+        """Validate the name (or title) and description lengths of a project or task."""
+        if not name or len(name) > cls._MAX_NAME_LEN:
+            raise ValidationError(f"{entity} {name_field} must be between 1 and "
+                                  f"{cls._MAX_NAME_LEN} characters.")
+        if len(description) > cls._MAX_DESCRIPTION_LEN:
+            raise ValidationError(f"{entity} description must be "
+                                  f"{cls._MAX_DESCRIPTION_LEN} characters or less.")
+
     @staticmethod
     def _parse_deadline(deadline_str: str | None) -> datetime | None:
         """Parse a deadline string into a datetime object."""
         if deadline_str is None:
             return None
+        # Fixed YYYY-MM-DD layout, so slice it directly instead of going through
+        # the generic (and much slower) strptime machinery.
+        digits = deadline_str[0:4] + deadline_str[5:7] + deadline_str[8:10]
+        # int() alone would also accept signs, spaces and underscores.
+        if (len(deadline_str) != 10 or deadline_str[4] != "-" or deadline_str[7] != "-"
+                or not (digits.isascii() and digits.isdigit())):
+            raise ValidationError("Invalid deadline format. Use YYYY-MM-DD")
         try:
-            return datetime.strptime(deadline_str, "%Y-%m-%d")
+            return datetime(int(deadline_str[0:4]), int(deadline_str[5:7]),
+                            int(deadline_str[8:10]))
         except ValueError:
-            raise ValidationError(f"Invalid deadline format. Use YYYY-MM-DD")
+            raise ValidationError("Invalid deadline format. Use YYYY-MM-DD")
 
     def create_project(self, name: str, description: str) -> Project:
         """Create a new project after validating business rules."""
-        if not name or len(name) > 30:
-            raise ValidationError("Project name must be between 1 and 30 characters.")
-        if len(description) > 150:
-            raise ValidationError("Project description must be 150 characters or less.")
+        self._validate_lengths("Project", "name", name, description)
 
-        if len(self._repo.list_projects()) >= self._max_projects:
+        if self._repo.count_projects() >= self._max_projects:
             raise ProjectLimitExceededError(f"Cannot create more than "
                                             f"{self._max_projects} projects.")
 
-        if self._repo.find_project_by_name(name) is not None:
+        if self._repo.find_project_id_by_name(name) is not None:
             raise DuplicateProjectNameError(name)
 
         return self._repo.create_project(name, description)
@@ -62,15 +88,13 @@ class ProjectService:
     def add_task_to_project(self, project_id: int, title: str,
                             description: str, deadline_str: str | None) -> Task:
         """Add a task to an existing project after validation."""
-        project = self._repo.find_project_by_id(project_id)
+        # Only the task count and name are read, so no copy of the project is needed.
+        project = self._repo.view_project(project_id)
 
         if len(project.tasks) >= self._max_tasks:
             raise TaskLimitExceededError(f"Project '{project.name}' cannot have"
                                          f" more tasks.")
-        if not title or len(title) > 30:
-            raise ValidationError("Task title must be between 1 and 30 characters.")
-        if len(description) > 150:
-            raise ValidationError("Task description must be 150 characters or less.")
+        self._validate_lengths("Task", "title", title, description)
 
         deadline = self._parse_deadline(deadline_str)
 
@@ -83,18 +107,19 @@ class ProjectService:
     def find_project_by_id(self, id: int) -> Project:
         """Find a project by its ID."""
         return self._repo.find_project_by_id(id)
+
+    def view_project(self, id: int) -> Project:
+        """Find a project by its ID for read-only use (e.g. displaying it)."""
+        return self._repo.view_project(id)
     
     def edit_project(self, project_id: int, new_name: str,
                      new_description: str) -> Project:
         """Edit an existing project after validating business rules."""
 
-        if not new_name or len(new_name) > 30:
-            raise ValidationError("Project name must be between 1 and 30 characters.")
-        if len(new_description) > 150:
-            raise ValidationError("Project description must be 150 characters or less.")
+        self._validate_lengths("Project", "name", new_name, new_description)
 
-        existing_project = self._repo.find_project_by_name(new_name)
-        if existing_project is not None and existing_project.id != project_id:
+        existing_id = self._repo.find_project_id_by_name(new_name)
+        if existing_id is not None and existing_id != project_id:
             raise DuplicateProjectNameError(new_name)
 
         return self._repo.update_project(project_id, new_name, new_description)
@@ -106,11 +131,10 @@ class ProjectService:
     def change_task_status(self, project_id: int, task_id: int,
                            new_status_str: str) -> Task:
         """Change the status of a task after validating."""
-        if new_status_str not in ("todo", "doing", "done"):
+        new_status = _STATUS_MAP.get(new_status_str)
+        if new_status is None:
             raise ValidationError("Task status must be either"
                                   " 'todo', 'doing' or 'done'.")
-
-        new_status: TaskStatus = new_status_str
         return self._repo.update_task_status(project_id, task_id, new_status)
 
     def edit_task(self, project_id: int, task_id: int, new_title: str,
@@ -118,17 +142,13 @@ class ProjectService:
                   new_deadline_str: str | None) -> Task:
         """Edit an existing task after validating."""
 
-        if not new_title or len(new_title) > 30:
-            raise ValidationError("Task title must be between 1 and 30 characters.")
-        if len(new_description) > 150:
-            raise ValidationError("Task description must be 150 characters or less.")
+        self._validate_lengths("Task", "title", new_title, new_description)
 
-        if new_status_str not in ("todo", "doing", "done"):
+        new_status = _STATUS_MAP.get(new_status_str)
+        if new_status is None:
             raise ValidationError("Task status must be either"
                                   " 'todo', 'doing' or 'done'.")
 
-        new_status: TaskStatus = new_status_str
-
         new_deadline = self._parse_deadline(new_deadline_str) if (new_deadline_str
                                                                   is not None) else None
         return self._repo.update_task(project_id, task_id, new_title, new_description,
@@ -142,19 +162,4 @@ class ProjectService:
         """Finds and closes all overdue tasks.
         Returns: The number of tasks that were closed.
         """
-        overdue_tasks = self._repo.find_overdue_tasks()
-        if not overdue_tasks:
-            return 0
-
-        now = datetime.now()
-        for task in overdue_tasks:
-            self._repo.update_task(
-                project_id=task.project_id,
-                task_id=task.id,
-                new_title=task.title,
-                new_description=task.description,
-                new_status="done",
-                new_deadline=task.deadline,
-                new_closed_at=now
-            )
-        return len(overdue_tasks)
\ No newline at end of file
+        return self._repo.close_overdue_tasks()